@@ -10,7 +10,14 @@ Environment variables:
   REMOTE_HOST, REMOTE_PORT, REMOTE_USER, REMOTE_PASSWORD
 """
 
+import collections
+import concurrent.futures
+import contextlib
+import hashlib
+import json
 import os
+import sys
+import threading
 import pymysql
 from pymysql.constants import CLIENT
 import pytest
@@ -195,6 +202,22 @@ if _cnf_remote_password is None:
         _cnf_remote_password = inception_pwd
 REMOTE_PASSWORD_DIRECT = REMOTE_PASSWORD or _cnf_remote_password or ""
 
+# Set in pytest-xdist worker processes (gw0, gw1, ...), unset otherwise.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+
+def _require_serial(what):
+    """
+    Refuse a server-wide change inside an xdist worker: every other worker's
+    CHECKs would see it. Tests that need one are marked serial, which skips
+    them on workers (see pytest_collection_modifyitems).
+    """
+    if _XDIST_WORKER is not None:
+        raise RuntimeError(
+            f"{what} changes server-wide state and cannot run under "
+            f"pytest-xdist; mark the test class @pytest.mark.serial"
+        )
+
 
 def _build_magic_start(host, port, mode_option, user=None, password=None, extra_params=""):
     """
@@ -230,6 +253,7 @@ def _connect_inception(multi_statements=False):
         "password": INCEPTION_PASSWORD,
         "charset": "utf8mb4",
         "autocommit": True,
+        "connect_timeout": 5,
     }
     if multi_statements:
         kwargs["client_flag"] = CLIENT.MULTI_STATEMENTS
@@ -244,17 +268,38 @@ def _find_inception_result(cur):
     """
     while True:
         if cur.description:
-            columns = [desc[0] for desc in cur.description]
+            # Interned so every row dict shares the source-literal key objects.
+            columns = [sys.intern(desc[0]) for desc in cur.description]
             if "sql_type" in columns:
-                rows = []
-                for row in cur.fetchall():
-                    rows.append(dict(zip(columns, row)))
-                return rows
+                return [dict(zip(columns, row)) for row in cur.fetchall()]
         if not cur.nextset():
             break
     return []
 
 
+def index_rows(rows):
+    """
+    Group result rows by base sql_type in a single pass, e.g.
+    {"CREATE_TABLE": [...], "ALTER_TABLE": [...]}. Sub-types after the '.'
+    (ALTER_TABLE.ADD_COLUMN) are folded into their base type; rows keep
+    statement order within each list.
+    """
+    index = {}
+    for row in rows:
+        kind = (row.get("sql_type") or "").split(".", 1)[0]
+        index.setdefault(kind, []).append(row)
+    return index
+
+
+def first_where(rows, pred):
+    """
+    Return the first row satisfying pred, or None. Stops at the first match
+    rather than building the full filtered list when a test only inspects
+    one row.
+    """
+    return next((row for row in rows if pred(row)), None)
+
+
 def inception_check(sql_block, **kwargs):
     """
     Send a CHECK-mode inception request.
@@ -277,13 +322,34 @@ def inception_check(sql_block, **kwargs):
     magic_commit = "/*inception_magic_commit;*/"
     full_sql = f"{magic_start}\n{sql_block}\n{magic_commit}"
 
-    conn = _connect_inception(multi_statements=True)
-    try:
-        cur = conn.cursor()
-        cur.execute(full_sql)
-        return _find_inception_result(cur)
-    finally:
-        conn.close()
+    return _cached_inception_request(full_sql, _find_inception_result)
+
+
+# Independent CHECK requests are latency-bound, so inception_check_many runs
+# them on a few long-lived worker threads; each thread keeps its own pooled
+# connection (see _cached_conn), so connections are reused across calls.
+_CHECK_WORKERS = 4
+_check_executor = None
+_check_executor_lock = threading.Lock()
+
+
+def inception_check_many(sql_blocks, **kwargs):
+    """
+    Send several CHECK-mode requests concurrently and return their result
+    lists in input order. Only for requests that do not depend on each other
+    or on GLOBAL variables changing in between.
+    """
+    global _check_executor
+    with _check_executor_lock:
+        if _check_executor is None:
+            _check_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_CHECK_WORKERS, thread_name_prefix="inception-check"
+            )
+    futures = [
+        _check_executor.submit(inception_check, sql_block, **kwargs)
+        for sql_block in sql_blocks
+    ]
+    return [future.result() for future in futures]
 
 
 def inception_execute(sql_block, **kwargs):
@@ -308,77 +374,444 @@ def inception_execute(sql_block, **kwargs):
     magic_commit = "/*inception_magic_commit;*/"
     full_sql = f"{magic_start}\n{sql_block}\n{magic_commit}"
 
-    conn = _connect_inception(multi_statements=True)
-    try:
-        cur = conn.cursor()
+    _invalidate_check_memo()
+    # No retry: the block may already have run, and the kill tests end this
+    # session on purpose.
+    with _pooled_cursor("inception", retry=False) as cur:
         cur.execute(full_sql)
-        return _find_inception_result(cur)
-    finally:
-        conn.close()
+        rows = _find_inception_result(cur)
+    _remote_dirty.set()
+    return rows
+
+
+def _connect_remote(multi_statements=False):
+    kwargs = {
+        "host": REMOTE_HOST,
+        "port": REMOTE_PORT,
+        "user": REMOTE_USER_DIRECT,
+        "password": REMOTE_PASSWORD_DIRECT,
+        "charset": "utf8mb4",
+        "autocommit": True,
+    }
+    if multi_statements:
+        kwargs["client_flag"] = CLIENT.MULTI_STATEMENTS
+    return pymysql.connect(**kwargs)
+
+
+# --- Persistent connections ---
+# Every helper (inception magic blocks, remote setup DDL, SET/SHOW GLOBAL)
+# reuses one connection per thread and target instead of paying TCP + auth
+# on every call. Closing the cursor drains any trailing result sets, so a
+# multi-statement inception block never leaves the socket out of sync. The
+# kill/sleep tests drive inception_execute from a worker thread, hence the
+# thread-local storage.
+_conn_local = threading.local()
+_open_conns = []
+_open_conns_lock = threading.Lock()
+
+# Set whenever a helper may have created objects on the remote target, so the
+# per-test cleanup can skip the DROP for pure CHECK/SPLIT/QUERY_TREE tests.
+# Only set once the statement went through: a call that never reached the
+# server has nothing to clean up.
+_remote_dirty = threading.Event()
+
+_CONN_FACTORIES = {
+    "remote": _connect_remote,
+    "remote_multi": lambda: _connect_remote(multi_statements=True),
+    "inception": lambda: _connect_inception(multi_statements=True),
+}
+
+
+def _cached_conn(key):
+    """
+    Return this thread's persistent connection for key, opening it on first
+    use. There is no ping per reuse: _pooled_cursor reconnects when a
+    statement finds the connection gone.
+    """
+    conns = getattr(_conn_local, "conns", None)
+    if conns is None:
+        conns = _conn_local.conns = {}
+    conn = conns.get(key)
+    if conn is None:
+        conn = _CONN_FACTORIES[key]()
+        conns[key] = conn
+        with _open_conns_lock:
+            _open_conns.append(conn)
+    return conn
+
+
+def _discard_conn(key):
+    conns = getattr(_conn_local, "conns", {})
+    conn = conns.pop(key, None)
+    if conn is not None:
+        with _open_conns_lock:
+            try:
+                _open_conns.remove(conn)
+            except ValueError:
+                pass
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+# CR_SERVER_GONE_ERROR / CR_SERVER_LOST: what a pooled connection reports
+# when the server closed it while idle (wait_timeout, restart).
+_RECONNECT_ERRORS = (2006, 2013)
+
+
+@contextlib.contextmanager
+def _pooled_cursor(key, retry=True):
+    """
+    Yield a cursor on the persistent connection for key. The connection is
+    dropped on any error so a half-read result never leaks into the next call.
+    With retry, a first execute() that finds the connection gone is sent once
+    more on a fresh connection; nothing has been read at that point.
+    """
+    conn = _cached_conn(key)
+    try:
+        with conn.cursor() as cur:
+            if retry:
+                execute = cur.execute
+
+                def execute_or_reconnect(query, args=None):
+                    cur.execute = execute
+                    try:
+                        return execute(query, args)
+                    except pymysql.err.OperationalError as exc:
+                        if exc.args[0] not in _RECONNECT_ERRORS:
+                            raise
+                    _discard_conn(key)
+                    cur.connection = _cached_conn(key)
+                    return execute(query, args)
+
+                cur.execute = execute_or_reconnect
+            yield cur
+    except BaseException:
+        _discard_conn(key)
+        raise
 
 
 def remote_query(sql):
     """Execute a query directly on the remote MySQL target."""
-    conn = pymysql.connect(
-        host=REMOTE_HOST,
-        port=REMOTE_PORT,
-        user=REMOTE_USER_DIRECT,
-        password=REMOTE_PASSWORD_DIRECT,
-        charset="utf8mb4",
-        autocommit=True,
-    )
-    try:
-        cur = conn.cursor()
+    with _pooled_cursor("remote") as cur:
         cur.execute(sql)
         if cur.description:
             return cur.fetchall()
         return None
-    finally:
-        conn.close()
 
 
 def remote_execute(sql):
     """Execute a statement directly on the remote MySQL target (no result)."""
-    conn = pymysql.connect(
-        host=REMOTE_HOST,
-        port=REMOTE_PORT,
-        user=REMOTE_USER_DIRECT,
-        password=REMOTE_PASSWORD_DIRECT,
-        charset="utf8mb4",
-        autocommit=True,
-    )
-    try:
-        cur = conn.cursor()
+    _invalidate_check_memo()
+    with _pooled_cursor("remote") as cur:
         cur.execute(sql)
+    _remote_dirty.set()
+
+
+def remote_execute_many(sql):
+    """
+    Execute a ';'-separated script on the remote MySQL target in a single
+    round-trip. All result sets are drained so errors in later statements
+    are raised here rather than silently dropped.
+    """
+    _invalidate_check_memo()
+    with _pooled_cursor("remote_multi") as cur:
+        cur.execute(sql)
+        try:
+            while cur.nextset():
+                pass
+        finally:
+            # The first statement went through even if a later one failed.
+            _remote_dirty.set()
+
+
+def _var_assignment(var_name, value):
+    """Return (sql_fragment, params) for one 'GLOBAL var = value' assignment."""
+    if isinstance(value, bool):
+        return f"GLOBAL {var_name} = {'ON' if value else 'OFF'}", ()
+    if isinstance(value, str):
+        return f"GLOBAL {var_name} = %s", (value,)
+    return f"GLOBAL {var_name} = {value}", ()
+
+
+# --- Opt-in response cache (--inception-response-cache) ---
+# CHECK and QUERY_TREE requests are side-effect free, so for local iteration
+# their responses can be replayed from .pytest_cache instead of hitting the
+# server again. The key covers the full request text (remote target, options,
+# SQL) plus a fingerprint of every inception_* GLOBAL, so changing a rule
+# level misses the cache. Remote schema contents are NOT part of the key:
+# use --cache-clear after changing the target database. The fingerprint is
+# read once and again only after set_inception_vars, so a hit costs no
+# round-trip. Requests embed test_db_name, which is therefore kept stable
+# while the cache is on; otherwise no key would survive into the next run.
+_RESPONSE_CACHE_KEY = "inception/responses"
+_response_cache = None
+_response_cache_loaded = frozenset()
+_response_cache_used = set()
+_vars_fingerprint = None
+
+
+def _inception_vars_fingerprint():
+    global _vars_fingerprint
+    if _vars_fingerprint is None:
+        with _pooled_cursor("inception") as cur:
+            cur.execute("SHOW GLOBAL VARIABLES LIKE 'inception%'")
+            rows = sorted(cur.fetchall())
+        _vars_fingerprint = hashlib.sha1(repr(rows).encode("utf-8")).hexdigest()
+    return _vars_fingerprint
+
+
+def _run_inception_request(full_sql, finder):
+    with _pooled_cursor("inception") as cur:
+        cur.execute(full_sql)
+        return finder(cur)
+
+
+# --- In-process memo for CHECK/QUERY_TREE ---
+# Many tests send the exact same read-only request more than once in a run
+# (shared fixtures, parametrized variants that only differ in assertions).
+# The answer only depends on the request text, the inception_* GLOBALs and
+# the remote schema, so results are memoized per process and the whole memo
+# is dropped whenever a helper changes a GLOBAL or may have written to the
+# remote. Keys are the exact request text: collapsing whitespace would alias
+# statements whose string literals differ only in spacing. Changes made by
+# another pytest-xdist worker are invisible to that invalidation, so the memo
+# is bypassed inside workers.
+_USE_CHECK_MEMO = _XDIST_WORKER is None
+_CHECK_MEMO_SIZE = 256
+_check_memo = collections.OrderedDict()
+_check_memo_lock = threading.Lock()
+
+
+def _invalidate_check_memo():
+    with _check_memo_lock:
+        _check_memo.clear()
+
+
+def _cached_inception_request(full_sql, finder):
+    """Run a read-only inception request, going through the response caches."""
+    if not _USE_CHECK_MEMO:
+        return [dict(row) for row in _fetch_inception_response(full_sql, finder)]
+    memo_key = (finder, full_sql)
+    with _check_memo_lock:
+        rows = _check_memo.get(memo_key)
+        if rows is not None:
+            _check_memo.move_to_end(memo_key)
+    if rows is None:
+        rows = _fetch_inception_response(full_sql, finder)
+        with _check_memo_lock:
+            _check_memo[memo_key] = rows
+            if len(_check_memo) > _CHECK_MEMO_SIZE:
+                _check_memo.popitem(last=False)
+    return [dict(row) for row in rows]
+
+
+def _fetch_inception_response(full_sql, finder):
+    """Run a read-only inception request, replaying it from disk if enabled."""
+    if _response_cache is None:
+        return _run_inception_request(full_sql, finder)
+    key = hashlib.sha1(
+        f"{_inception_vars_fingerprint()}\0{full_sql}".encode("utf-8")
+    ).hexdigest()
+    rows = _response_cache.get(key)
+    if rows is None:
+        rows = _run_inception_request(full_sql, finder)
+        try:
+            json.dumps(rows)
+        except TypeError:
+            return rows
+        _response_cache[key] = rows
+    _response_cache_used.add(key)
+    return [dict(row) for row in rows]
+
+
+@contextlib.contextmanager
+def remote_schema(db_name, script="", skip_reason=None):
+    """
+    Create db_name on the remote (plus an optional ';'-terminated DDL script)
+    for the duration of the block, then drop it. Meant for class-scoped
+    fixtures: the per-test _cleanup_test_db leaves the schema in place unless
+    a test itself writes to the remote. Setup failures propagate, or skip the
+    tests instead when skip_reason is given.
+    """
+    was_dirty = _remote_dirty.is_set()
+    try:
+        remote_execute_many(f"CREATE DATABASE IF NOT EXISTS `{db_name}`;{script}")
+    except Exception:
+        # Undo a partly applied script and leave the dirty flag as it was, so
+        # the per-test cleanup does not turn the skip into a teardown error.
+        try:
+            remote_execute(f"DROP DATABASE IF EXISTS `{db_name}`")
+        except Exception:
+            pass
+        if not was_dirty:
+            _remote_dirty.clear()
+        if skip_reason is None:
+            raise
+        pytest.skip(skip_reason)
+    if not was_dirty:
+        # Only the setup above wrote to the remote, and it stays for the class.
+        _remote_dirty.clear()
+    try:
+        yield
     finally:
-        conn.close()
+        remote_execute(f"DROP DATABASE IF EXISTS `{db_name}`")
+        _remote_dirty.clear()
 
 
-def set_inception_var(var_name, value):
-    """Set a GLOBAL inception system variable on the inception server."""
-    conn = _connect_inception()
+@contextlib.contextmanager
+def remote_global_var(var_name, value, restore, skip_reason=None):
+    """
+    Set a GLOBAL variable on the remote for the duration of the block and
+    set it back to restore on exit. The caller supplies restore (usually a
+    baseline read once per module) so no read-back is needed. If the SET
+    fails, the test is skipped when skip_reason is given.
+    """
+    _require_serial(f"SET GLOBAL {var_name}")
+    try:
+        remote_execute(f"SET GLOBAL {var_name}={value}")
+    except Exception as exc:
+        if skip_reason is None:
+            raise
+        pytest.skip(f"{skip_reason}: {exc}")
     try:
-        cur = conn.cursor()
-        if isinstance(value, bool):
-            cur.execute(f"SET GLOBAL {var_name} = {'ON' if value else 'OFF'}")
-        elif isinstance(value, str):
-            cur.execute(f"SET GLOBAL {var_name} = %s", (value,))
-        else:
-            cur.execute(f"SET GLOBAL {var_name} = {value}")
+        yield
     finally:
-        conn.close()
+        remote_execute(f"SET GLOBAL {var_name}={restore}")
+
+
+# Process-local mirror of inception_* GLOBALs as SHOW VARIABLES reported
+# them. Reads fill it lazily; a SET drops the affected entries (the server
+# normalizes values, e.g. 2 -> ERROR, so the assigned value is not what a
+# later SHOW returns) and is skipped entirely for variables the mirror
+# already shows at the requested value, which makes restoring an unchanged
+# original free. Only these helpers change the globals during a run, which
+# does not hold across pytest-xdist workers, so there the mirror stays empty
+# and every read and SET goes to the server.
+_MIRROR_VARS = _XDIST_WORKER is None
+_var_mirror = {}
+
+# Text of the last value each variable was SET to through these helpers, so
+# assigning the same value twice in a row (the mirror no longer has an entry
+# after the first SET) is skipped too. Like the mirror it is only kept
+# outside pytest-xdist workers.
+_var_assigned = {}
+
+
+def _mirror_text(value):
+    if isinstance(value, bool):
+        return "ON" if value else "OFF"
+    return str(value)
+
+
+def set_inception_var(var_name, value):
+    """Set a GLOBAL inception system variable on the inception server."""
+    set_inception_vars({var_name: value})
+
+
+def set_inception_vars(values):
+    """Set several GLOBAL inception system variables in one SET statement."""
+    global _vars_fingerprint
+    _require_serial("SET GLOBAL " + ", ".join(values))
+    pending = {
+        var_name: value for var_name, value in values.items()
+        if _mirror_text(value) not in (_var_mirror.get(var_name),
+                                       _var_assigned.get(var_name))
+    }
+    if not pending:
+        return
+    fragments = []
+    params = []
+    for var_name, value in pending.items():
+        fragment, args = _var_assignment(var_name, value)
+        fragments.append(fragment)
+        params.extend(args)
+        _var_mirror.pop(var_name, None)
+        _var_assigned.pop(var_name, None)
+    _invalidate_check_memo()
+    _vars_fingerprint = None
+    with _pooled_cursor("inception") as cur:
+        cur.execute("SET " + ", ".join(fragments), tuple(params) or None)
+    if _MIRROR_VARS:
+        _var_assigned.update(
+            (var_name, _mirror_text(value)) for var_name, value in pending.items()
+        )
 
 
 def get_inception_var(var_name):
     """Get a GLOBAL inception system variable from the inception server."""
-    conn = _connect_inception()
-    try:
-        cur = conn.cursor()
+    if var_name in _var_mirror:
+        return _var_mirror[var_name]
+    with _pooled_cursor("inception") as cur:
         cur.execute(f"SHOW GLOBAL VARIABLES LIKE '{var_name}'")
         row = cur.fetchone()
-        return row[1] if row else None
+    if row is None:
+        return None
+    if _MIRROR_VARS:
+        _var_mirror[var_name] = row[1]
+    return row[1]
+
+
+def get_inception_vars(var_names):
+    """Get several GLOBAL inception system variables with one query, as a dict."""
+    var_names = list(var_names)
+    found = {name: _var_mirror[name] for name in var_names if name in _var_mirror}
+    missing = [name for name in var_names if name not in found]
+    if missing:
+        placeholders = ", ".join(["%s"] * len(missing))
+        with _pooled_cursor("inception") as cur:
+            cur.execute(
+                f"SHOW GLOBAL VARIABLES WHERE Variable_name IN ({placeholders})",
+                tuple(missing),
+            )
+            found.update(cur.fetchall())
+        if _MIRROR_VARS:
+            _var_mirror.update(found)
+    return {name: found[name] for name in var_names if name in found}
+
+
+def _restorable(value):
+    """
+    SHOW VARIABLES reports everything as text; integer sysvars reject a quoted
+    value on SET, so hand digits back as int.
+    """
+    if value is not None and value.lstrip("-").isdigit():
+        return int(value)
+    return value
+
+
+@contextlib.contextmanager
+def preserve_inception_vars(*var_names):
+    """
+    Snapshot the named GLOBAL inception variables and restore them on exit,
+    one round-trip each way. Handy as a class-scoped fixture when every test
+    in the class sets its own values and only the class as a whole needs to
+    leave the server as it found it.
+    """
+    original = get_inception_vars(var_names)
+    try:
+        yield
     finally:
-        conn.close()
+        set_inception_vars({
+            name: _restorable(original[name])
+            for name in var_names if name in original
+        })
+
+
+@contextlib.contextmanager
+def inception_vars(**values):
+    """
+    Temporarily set GLOBAL inception variables, restoring the previous values
+    on exit. The snapshot, the change and the restore are one round-trip each:
+
+        with inception_vars(inception_check_nullable=0,
+                            inception_must_have_columns="id BIGINT UNSIGNED"):
+            rows = inception_check(...)
+    """
+    with preserve_inception_vars(*values):
+        set_inception_vars(values)
+        yield
 
 
 def _find_split_result(cur):
@@ -408,12 +841,10 @@ def _find_query_tree_result(cur):
     """
     while True:
         if cur.description:
-            columns = [desc[0] for desc in cur.description]
+            # Interned so every row dict shares the source-literal key objects.
+            columns = [sys.intern(desc[0]) for desc in cur.description]
             if "query_tree" in columns:
-                rows = []
-                for row in cur.fetchall():
-                    rows.append(dict(zip(columns, row)))
-                return rows
+                return [dict(zip(columns, row)) for row in cur.fetchall()]
         if not cur.nextset():
             break
     return []
@@ -439,13 +870,9 @@ def inception_split(sql_block, **kwargs):
     magic_commit = "/*inception_magic_commit;*/"
     full_sql = f"{magic_start}\n{sql_block}\n{magic_commit}"
 
-    conn = _connect_inception(multi_statements=True)
-    try:
-        cur = conn.cursor()
+    with _pooled_cursor("inception") as cur:
         cur.execute(full_sql)
         return _find_split_result(cur)
-    finally:
-        conn.close()
 
 
 def inception_query_tree(sql_block, **kwargs):
@@ -468,62 +895,178 @@ def inception_query_tree(sql_block, **kwargs):
     magic_commit = "/*inception_magic_commit;*/"
     full_sql = f"{magic_start}\n{sql_block}\n{magic_commit}"
 
-    conn = _connect_inception(multi_statements=True)
-    try:
-        cur = conn.cursor()
-        cur.execute(full_sql)
-        return _find_query_tree_result(cur)
-    finally:
-        conn.close()
+    return _cached_inception_request(full_sql, _find_query_tree_result)
 
 
 def inception_get_sqltypes():
     """
     Execute 'inception get sqltypes' and return result as list of dicts.
     """
-    conn = _connect_inception()
-    try:
-        cur = conn.cursor()
+    with _pooled_cursor("inception") as cur:
         cur.execute("inception get sqltypes;")
         if cur.description:
             columns = [desc[0] for desc in cur.description]
             return [dict(zip(columns, row)) for row in cur.fetchall()]
         return []
-    finally:
-        conn.close()
 
 
 def inception_get_encrypt_password(plain_password):
     """
     Execute 'inception get encrypt_password' and return the encrypted string.
     """
-    conn = _connect_inception()
-    try:
-        cur = conn.cursor()
+    with _pooled_cursor("inception") as cur:
         cur.execute(f"inception get encrypt_password '{plain_password}';")
         if cur.description:
             row = cur.fetchone()
             return row[0] if row else None
         return None
-    finally:
-        conn.close()
+
+
+@pytest.fixture(scope="module")
+def inception_conn():
+    """
+    One plain autocommit connection to the inception server, shared by the
+    module's admin-command tests (inception kill / set sleep). Server-side
+    errors leave the connection usable, so tests can expect them freely.
+    """
+    conn = _connect_inception()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def nullable_off():
+    """
+    Turn inception_check_nullable off for one test and restore the previous
+    level afterwards, for tests whose DDL has nullable columns but which
+    assert on some other rule or on execution.
+    """
+    with inception_vars(inception_check_nullable=0):
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _close_pooled_connections():
+    """Close every persistent helper connection at the end of the session."""
+    yield
+    if _check_executor is not None:
+        _check_executor.shutdown(wait=True)
+    with _open_conns_lock:
+        conns = list(_open_conns)
+        del _open_conns[:]
+    for conn in conns:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--inception-response-cache",
+        action="store_true",
+        default=False,
+        help="replay CHECK/QUERY_TREE responses from .pytest_cache "
+             "(invalidate with --cache-clear)",
+    )
+
+
+def pytest_configure(config):
+    global _response_cache, _response_cache_loaded
+    # Registered here so the marker is known even when pytest-xdist is absent.
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run all tests of the group on the same xdist worker "
+        "(keeps a class and its class-scoped fixtures together)",
+    )
+    config.addinivalue_line(
+        "markers",
+        "serial: changes server-wide state (inception or remote GLOBALs, "
+        "server sessions); skipped under pytest-xdist, run with -p no:xdist",
+    )
+    cache = getattr(config, "cache", None)
+    if config.getoption("--inception-response-cache") and cache is not None:
+        _response_cache = dict(cache.get(_RESPONSE_CACHE_KEY, {}))
+        _response_cache_loaded = frozenset(_response_cache)
+
+
+def pytest_collection_modifyitems(config, items):
+    # Under --dist=loadgroup keep each class on one worker, so class-scoped
+    # schemas and batched CHECKs are built once rather than once per worker
+    # the class happens to be split across. Explicit groups win. Tests that
+    # change server-wide state would leak into every other worker's CHECKs,
+    # so on a worker they are skipped and left to a serial run.
+    for item in items:
+        if _XDIST_WORKER is not None and item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.skip(
+                reason="changes server GLOBALs; run -m serial -p no:xdist"))
+        if item.cls is not None and item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(item.cls.__name__))
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _response_cache_used:
+        replayed = len(_response_cache_used & _response_cache_loaded)
+        terminalreporter.write_line(
+            f"inception response cache: {replayed} replayed, "
+            f"{len(_response_cache_used) - replayed} fetched"
+        )
+
+
+def pytest_unconfigure(config):
+    # Persist only the entries this run used, so the file cannot grow forever.
+    cache = getattr(config, "cache", None)
+    if _response_cache is not None and cache is not None:
+        cache.set(
+            _RESPONSE_CACHE_KEY,
+            {k: v for k, v in _response_cache.items() if k in _response_cache_used},
+        )
 
 
 @pytest.fixture(scope="session")
 def test_db_name():
-    """Unique database name for this test session."""
+    """
+    Unique database name for this test session.
+    Under pytest-xdist the worker id (gw0, gw1, ...) is appended so that
+    parallel workers never share a remote schema. With
+    --inception-response-cache the name is fixed, so cached requests match
+    across runs.
+    """
     import time
-    return f"inception_test_{int(time.time())}"
+    if _response_cache is not None:
+        name = "inception_test"
+    else:
+        name = f"inception_test_{int(time.time())}"
+    if _XDIST_WORKER:
+        name = f"{name}_{_XDIST_WORKER}"
+    return name
+
+
+@pytest.fixture(scope="session")
+def remote_available():
+    """
+    True if the remote MySQL target answers a trivial query. Probed once per
+    session so remote-dependent fixtures can skip up front instead of every
+    test waiting out its own connect timeout.
+    """
+    try:
+        remote_query("SELECT 1")
+    except Exception:
+        return False
+    return True
 
 
 @pytest.fixture(autouse=True)
-def _cleanup_test_db(test_db_name):
+def _cleanup_test_db(test_db_name, remote_available):
     """
     Auto-cleanup: drop the test database on remote after each test.
-    This ensures tests are independent.
+    This ensures tests are independent. Tests that never reached the remote
+    through remote_execute*/inception_execute have nothing to drop, and an
+    unreachable remote has nothing that could be dropped.
     """
     yield
-    try:
+    if not _remote_dirty.is_set():
+        return
+    if remote_available:
         remote_execute(f"DROP DATABASE IF EXISTS `{test_db_name}`")
-    except Exception:
-        pass
+    _remote_dirty.clear()